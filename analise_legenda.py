@@ -1,157 +1,237 @@
+import codecs
 import re
+import sys
 import chardet
 from datetime import timedelta
-from colorama import Fore, init, Back, Style
 
-init(autoreset=True)
+if sys.stdout.isatty():
+    from colorama import Fore, Style, init
+    init(autoreset=True)
+else:
+    # Output is redirected: colorama would only strip the codes again, so don't emit any
+    class _NoColor:
+        def __getattr__(self, name):
+            return ''
+    Fore = Style = _NoColor()
 
-def detect_encoding(file_path):
-    """Detect the encoding of the file."""
+READ_BUFFER_SIZE = 16 * 1024 * 1024
+ENCODING_SAMPLE_SIZE = 64 * 1024
+MAX_CHARS_PER_LINE = 42
+
+# HTML tags, formatting blocks like {\an8} and other codes like \N, in a single pass
+_CLEAN_RE = re.compile(r'<[^>]*>|\{[^}]*\}|\\[a-zA-Z]+\b')
+_strip_markup = _CLEAN_RE.sub  # bound once: clean_text runs for every text line
+# Full timing line layout (HH:MM:SS,mmm --> HH:MM:SS,mmm); ASCII digits only, since parse_time does ord arithmetic
+_TIME_RE = re.compile(r'\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3}', re.ASCII)
+
+class Subtitle:
+    """A subtitle block with its text lines cleaned once, at parse time, for every later consumer."""
+    __slots__ = ('start', 'end', 'text_lines', 'clean_lines', 'lengths', 'number', 'encoding')
+
+    def __init__(self, start, end, text_lines, number, encoding):
+        self.start = start  # milliseconds
+        self.end = end  # milliseconds
+        self.text_lines = text_lines
+        self.clean_lines = [clean_text(line) for line in text_lines]
+        self.lengths = [len(line) for line in self.clean_lines]
+        self.number = number
+        self.encoding = encoding
+
+def detect_encoding(file_path, sample_size=ENCODING_SAMPLE_SIZE):
+    """Detect the encoding of the file from its BOM or, failing that, from its first `sample_size` bytes (None: the whole file)."""
     with open(file_path, 'rb') as file:
-        raw_data = file.read()
+        raw_data = file.read(sample_size)
+    if raw_data.startswith(codecs.BOM_UTF8):
+        return 'UTF-8-SIG'
+    if raw_data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'UTF-16'
     result = chardet.detect(raw_data)
-    return result['encoding']
+    return result['encoding'] or 'utf-8'
 
 def parse_srt(file_path):
-    """Parse an SRT file and return a list of subtitles with start time, end time, and text."""
+    """Parse an SRT file and return a list of Subtitle objects with start time, end time, and text."""
     encoding = detect_encoding(file_path)
-    with open(file_path, 'r', encoding=encoding) as file:
-        content = file.read()
-    
-    # Split subtitles by blocks
-    blocks = content.strip().split('\n\n')
+    try:
+        return _read_subtitles(file_path, encoding)
+    except UnicodeDecodeError:
+        # The sample didn't represent the file (e.g. it was all ASCII): detect again from all of it
+        encoding = detect_encoding(file_path, None)
+        return _read_subtitles(file_path, encoding)
+
+def _read_subtitles(file_path, encoding):
+    """Read the subtitle blocks of the file decoded with `encoding`."""
     subtitles = []
-    
-    for block in blocks:
-        lines = block.split('\n')
-        if len(lines) < 3:
-            continue
-        
-        # Extract times and text
-        time_match = re.match(r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})", lines[1])
-        if not time_match:
-            continue
-
-        start_time = parse_time(time_match.group(1))
-        end_time = parse_time(time_match.group(2))
-        text_lines = lines[2:]  # Each line of text is treated separately
-        subtitles.append((start_time, end_time, text_lines, int(lines[0]), encoding))
+
+    # Stream the file line by line, keeping only the current block in memory.
+    # newline='' skips the newline translation; both \n and \r\n endings are stripped here.
+    block = []
+    with open(file_path, 'r', encoding=encoding, newline='', buffering=READ_BUFFER_SIZE) as file:
+        for line in file:
+            line = line.rstrip('\r\n')
+            if line:
+                block.append(line)
+            elif block:
+                _append_block(subtitles, block, encoding)
+                block = []
+    if block:
+        _append_block(subtitles, block, encoding)
     return subtitles
 
-def parse_time(timestamp):
-    """Convert SRT timestamp to timedelta."""
-    hours, minutes, seconds = map(int, timestamp[:8].split(':'))
-    milliseconds = int(timestamp[9:12])
-    return timedelta(hours=hours, minutes=minutes, seconds=seconds, milliseconds=milliseconds)
+def _append_block(subtitles, lines, encoding):
+    """Parse one subtitle block (number, timing line, text lines) and append it to `subtitles`."""
+    if len(lines) < 3:
+        return
+
+    # Extract times and text (fixed width: HH:MM:SS,mmm --> HH:MM:SS,mmm)
+    time_line = lines[1]
+    if not _TIME_RE.match(time_line):
+        return
+
+    start_time = parse_time(time_line)
+    end_time = parse_time(time_line, 17)
+    text_lines = lines[2:]  # Each line of text is treated separately
+    subtitles.append(Subtitle(start_time, end_time, text_lines, int(lines[0]), encoding))
+
+def parse_time(timestamp, offset=0):
+    """Convert the SRT timestamp starting at `offset` to an integer number of milliseconds."""
+    o = offset
+    return ((ord(timestamp[o]) - 48) * 36000000 + (ord(timestamp[o + 1]) - 48) * 3600000
+            + (ord(timestamp[o + 3]) - 48) * 600000 + (ord(timestamp[o + 4]) - 48) * 60000
+            + (ord(timestamp[o + 6]) - 48) * 10000 + (ord(timestamp[o + 7]) - 48) * 1000
+            + (ord(timestamp[o + 9]) - 48) * 100 + (ord(timestamp[o + 10]) - 48) * 10
+            + (ord(timestamp[o + 11]) - 48))
 
 def clean_text(text):
     """Remove non-printable characters such as HTML tags and special formatting codes."""
-    # Remove HTML tags
-    text = re.sub(r'<.*?>', '', text)
-    # Remove additional non-printable characters or codes
-    text = re.sub(r'\{.*?\}', '', text)  # Example: formatting like {\an8}
-    text = re.sub(r'\\[a-zA-Z]+\b', '', text)  # Other formatting codes like \N
-    return text.strip()
-
-def format_timedelta(td):
-    """Formata um timedelta para string no formato HH:MM:SS,mmm"""
-    total_seconds = int(td.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
-    milliseconds = td.microseconds // 1000
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
-
-def calculate_statistics(subtitles):
-    """Calculate statistics from the subtitles."""
+    # Most subtitle lines carry no markup at all: skip the regex for them
+    if '<' not in text and '{' not in text and '\\' not in text:
+        return text.strip()
+    return _strip_markup('', text).strip()
+
+def format_ms(ms):
+    """Formata um tempo em milissegundos para string no formato HH:MM:SS,mmm"""
+    sign = "-" if ms < 0 else ""
+    total_seconds, milliseconds = divmod(abs(ms), 1000)
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+def write_lines(lines):
+    """Write a block of report lines to stdout with a single call."""
+    # colorama's autoreset only fires once per write, so colored lines must end with Style.RESET_ALL
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def calculate_statistics(subtitles, max_chars_threshold=MAX_CHARS_PER_LINE):
+    """Calculate statistics from the subtitles, flagging lines longer than `max_chars_threshold` characters."""
     num_lines = len(subtitles)
-    start_time = subtitles[0][0] if subtitles else timedelta(0)  # Get the first subtitle's start time
-    total_duration = subtitles[-1][1] if subtitles else timedelta(0)
-    total_display_time = sum((end - start for start, end, _, _, _ in subtitles), timedelta(0))
-    
-    # Calculate total time without subtitles
-    total_time_without_subtitles = total_duration - total_display_time
-    
-    # Calculate percentages
-    total_seconds = total_duration.total_seconds()
-    display_percentage = (total_display_time.total_seconds() / total_seconds * 100) if total_seconds > 0 else 0
-    without_subtitles_percentage = (total_time_without_subtitles.total_seconds() / total_seconds * 100) if total_seconds > 0 else 0
+    start_time = subtitles[0].start if subtitles else 0  # Get the first subtitle's start time
+    total_duration = subtitles[-1].end if subtitles else 0
+
+    total_display_time = 0
+    total_words = 0
+    total_characters = 0
+    # Seed min/max with the first subtitle so the loop needs no "unset" checks
+    min_duration = max_duration = subtitles[0].end - subtitles[0].start if subtitles else 0
 
     # Line count statistics
     single_lines = []
     double_lines = []
     triple_lines = []
     quadruple_lines = []
-    
-    for subtitle in subtitles:
-        text_lines = [line for line in subtitle[2] if clean_text(line)]
-        num_text_lines = len(text_lines)
-        if num_text_lines == 1:
-            single_lines.append(subtitle[3])
-        elif num_text_lines == 2:
-            double_lines.append(subtitle[3])
-        elif num_text_lines == 3:
-            triple_lines.append(subtitle[3])
-        elif num_text_lines >= 4:
-            quadruple_lines.append(subtitle[3])
 
-    total_words = sum(len(clean_text(line).split()) for _, _, text_lines, _, _ in subtitles for line in text_lines)
-    total_characters = sum(len(clean_text(line)) for _, _, text_lines, _, _ in subtitles for line in text_lines)
-    avg_words_per_line = total_words / num_lines if num_lines > 0 else 0
-    avg_chars_per_line = total_characters / num_lines if num_lines > 0 else 0
-
-    durations = [end - start for start, end, _, _, _ in subtitles]
-    avg_duration = sum(durations, timedelta(0)) / num_lines if num_lines > 0 else timedelta(0)
-    min_duration = min(durations, default=timedelta(0))
-    max_duration = max(durations, default=timedelta(0))
-
-    reading_rate_words = total_words / total_display_time.total_seconds() if total_display_time.total_seconds() > 0 else 0
-    reading_rate_chars = total_characters / total_display_time.total_seconds() if total_display_time.total_seconds() > 0 else 0
+    # Longest line and every line tied with it
+    longest_length = -1
+    longest_line = ""
+    longest_lines = []  # (line number, cleaned line) pairs
 
-    # Find longest line and similar length lines
-    all_lines = [(subtitle[3], line) for subtitle in subtitles for line in subtitle[2]]
-    longest_length = max(len(clean_text(line)) for _, line in all_lines)
-    longest_lines = [(num, line) for num, line in all_lines if len(clean_text(line)) == longest_length]
-    
-    longest_line = longest_lines[0][1] if longest_lines else ""
-    max_chars_line = longest_line
-
-    # Modified to only include unique subtitle numbers
-    lines_with_more_than_42_chars = set()  # Using a set to store unique line numbers
+    # Subtitles with a line longer than the threshold (one entry per subtitle number)
     line_contents = []  # Store line contents for display
-    for _, _, text_lines, line_num, _ in subtitles:
-        if any(len(clean_text(line)) > 42 for line in text_lines):
-            lines_with_more_than_42_chars.add(line_num)
-            line_contents.append((line_num, [clean_text(l) for l in text_lines if clean_text(l)]))
 
     # Detectar legendas com menos de 0,9 segundos
     short_duration_lines = []
-    one_second = timedelta(seconds=0.9)
-    for subtitle in subtitles:
-        duration = subtitle[1] - subtitle[0]
+    one_second = 900
+
+    overlaps = []  # (first subtitle index, second subtitle index, overlap duration)
+    previous_end = -1  # Timestamps are never negative, so the first subtitle cannot overlap
+
+    # Single pass over the subtitles: every statistic is accumulated here
+    for index, subtitle in enumerate(subtitles):
+        start = subtitle.start
+        end = subtitle.end
+        line_num = subtitle.number
+        duration = end - start
+        total_display_time += duration
+        if duration < min_duration:
+            min_duration = duration
+        elif duration > max_duration:
+            max_duration = duration
+
+        clean_lines = subtitle.clean_lines
+        lengths = subtitle.lengths
+        max_length = max(lengths, default=0)
+        num_text_lines = len(lengths) - lengths.count(0)
+        total_characters += sum(lengths)
+        for clean_line in clean_lines:
+            total_words += len(clean_line.split())
+
+        # Only subtitles reaching the current maximum can change the longest lines
+        if max_length >= longest_length:
+            for line, clean_line, length in zip(subtitle.text_lines, clean_lines, lengths):
+                if length > longest_length:
+                    longest_length = length
+                    longest_line = line
+                    longest_lines = [(line_num, clean_line)]
+                elif length == longest_length:
+                    longest_lines.append((line_num, clean_line))
+
+        if num_text_lines == 1:
+            single_lines.append(line_num)
+        elif num_text_lines == 2:
+            double_lines.append(line_num)
+        elif num_text_lines == 3:
+            triple_lines.append(line_num)
+        elif num_text_lines >= 4:
+            quadruple_lines.append(line_num)
+
+        if max_length > max_chars_threshold:
+            line_contents.append((line_num, [(l, n) for l, n in zip(clean_lines, lengths) if n]))
+
         if duration < one_second:
             short_duration_lines.append({
-                'number': subtitle[3],
-                'start': subtitle[0],
-                'end': subtitle[1],
+                'number': line_num,
+                'start': start,
+                'end': end,
                 'duration': duration,
-                'text': subtitle[2]
+                'text': subtitle.text_lines,
+                'clean_text': list(zip(clean_lines, lengths))
             })
 
-    overlaps = []
-    for i in range(len(subtitles) - 1):
-        if subtitles[i][1] > subtitles[i + 1][0]:
+        if previous_end > start:
             # Calcular o tempo de overlap
-            overlap_start = subtitles[i + 1][0]
-            overlap_end = min(subtitles[i][1], subtitles[i + 1][1])
-            overlap_duration = overlap_end - overlap_start
-            overlaps.append((
-                (subtitles[i], subtitles[i][0], subtitles[i][1]),  # Primeira legenda com seus tempos
-                (subtitles[i + 1], subtitles[i + 1][0], subtitles[i + 1][1]),  # Segunda legenda com seus tempos
-                overlap_duration  # Duração do overlap
-            ))
+            overlap_duration = min(previous_end, end) - start
+            overlaps.append((index - 1, index, overlap_duration))
+        previous_end = end
+
+    # Calculate total time without subtitles
+    total_time_without_subtitles = total_duration - total_display_time
 
-    encoding = subtitles[0][4] if subtitles else "Unknown"
+    # Calculate percentages
+    display_percentage = (total_display_time / total_duration * 100) if total_duration > 0 else 0
+    without_subtitles_percentage = (total_time_without_subtitles / total_duration * 100) if total_duration > 0 else 0
+
+    avg_words_per_line = total_words / num_lines if num_lines > 0 else 0
+    avg_chars_per_line = total_characters / num_lines if num_lines > 0 else 0
+
+    avg_duration = total_display_time / num_lines if num_lines > 0 else 0
+
+    display_seconds = total_display_time / 1000
+    reading_rate_words = total_words / display_seconds if display_seconds > 0 else 0
+    reading_rate_chars = total_characters / display_seconds if display_seconds > 0 else 0
+
+    max_chars_line = longest_line
+    longest_line_clean = longest_lines[0][1] if longest_lines else ""
+
+    encoding = subtitles[0].encoding if subtitles else "Unknown"
 
     return {
         "num_lines": num_lines,
@@ -172,7 +252,10 @@ def calculate_statistics(subtitles):
         "reading_rate_chars": reading_rate_chars,
         "longest_line": longest_line,
         "max_chars_line": max_chars_line,
-        "lines_with_more_than_42_chars": (lines_with_more_than_42_chars, line_contents),
+        "longest_line_clean": longest_line_clean,
+        "longest_line_len": len(longest_line_clean),
+        "max_chars_threshold": max_chars_threshold,
+        "long_lines": line_contents,
         "overlaps": overlaps,
         "short_duration_lines": short_duration_lines,
         "single_lines": single_lines,
@@ -196,11 +279,11 @@ def main():
     print()
     print(f"Number of lines: {Fore.BLUE}{stats['num_lines']}")
     print()
-    print(f"Subtitles starts at: {Fore.BLUE}{format_timedelta(stats['start_time'])}")
-    print(f"Subtitle ends at:    {Fore.BLUE}{format_timedelta(stats['total_duration'])}")
+    print(f"Subtitles starts at: {Fore.BLUE}{format_ms(stats['start_time'])}")
+    print(f"Subtitle ends at:    {Fore.BLUE}{format_ms(stats['total_duration'])}")
     print()
-    print(f"Total subtitle display time:  {Fore.BLUE}{format_timedelta(stats['total_display_time'])}  {Fore.CYAN}({stats['display_percentage']:.1f}%)")
-    print(f"Total time without subtitles: {Fore.BLUE}{format_timedelta(stats['total_time_without_subtitles'])}  {Fore.CYAN}({stats['without_subtitles_percentage']:.1f}%)")
+    print(f"Total subtitle display time:  {Fore.BLUE}{format_ms(stats['total_display_time'])}  {Fore.CYAN}({stats['display_percentage']:.1f}%)")
+    print(f"Total time without subtitles: {Fore.BLUE}{format_ms(stats['total_time_without_subtitles'])}  {Fore.CYAN}({stats['without_subtitles_percentage']:.1f}%)")
     print()
     print(f"Single lines: {Fore.BLUE}{len(stats['single_lines'])}")
     print(f"Double lines: {Fore.BLUE}{len(stats['double_lines'])}")
@@ -222,77 +305,77 @@ def main():
     print(f"Average words per line: {Fore.BLUE}{stats['avg_words_per_line']:.2f}")
     print(f"Average characters per line: {Fore.BLUE}{stats['avg_chars_per_line']:.2f}")
     print()
-    print(f"Shortest line duration: {Fore.BLUE}{stats['min_duration']}")
-    print(f"Average line duration:  {Fore.BLUE}{stats['avg_duration']}")
-    print(f"Longest line duration:  {Fore.BLUE}{stats['max_duration']}")
+    print(f"Shortest line duration: {Fore.BLUE}{timedelta(milliseconds=stats['min_duration'])}")
+    print(f"Average line duration:  {Fore.BLUE}{timedelta(milliseconds=stats['avg_duration'])}")
+    print(f"Longest line duration:  {Fore.BLUE}{timedelta(milliseconds=stats['max_duration'])}")
     print()
     print(f"Reading rate (words/sec):      {Fore.BLUE}{stats['reading_rate_words']:.2f}")
     print(f"Reading rate (characters/sec): {Fore.BLUE}{stats['reading_rate_chars']:.2f}")
     print()
-    print(f"Maximum characters in a line: {Fore.BLUE}{len(clean_text(stats['max_chars_line']))}")
-    print(f"Lines with maximum length ({len(clean_text(stats['max_chars_line']))} characters): {Fore.BLUE}{len(stats['longest_lines'])}")
+    print(f"Maximum characters in a line: {Fore.BLUE}{stats['longest_line_len']}")
+    print(f"Lines with maximum length ({stats['longest_line_len']} characters): {Fore.BLUE}{len(stats['longest_lines'])}")
     for num, line in stats['longest_lines']:
-        print(f"  {Fore.YELLOW}- Line {num}:\t{Style.RESET_ALL} {clean_text(line)}")
+        print(f"  {Fore.YELLOW}- Line {num}:\t{Style.RESET_ALL} {line}")
 
-    long_lines_set, line_contents = stats['lines_with_more_than_42_chars']
+    threshold = stats['max_chars_threshold']
+    line_contents = stats['long_lines']
     if line_contents:
-        print("\n------------------------------------------")
-        print(f"\n{Fore.YELLOW}LINES{Style.RESET_ALL} WITH MORE THAN 42 {Fore.GREEN}CHARACTERS{Style.RESET_ALL}: {Fore.BLUE}{len(long_lines_set)}\n")
+        out = [
+            "\n------------------------------------------",
+            f"\n{Fore.YELLOW}LINES{Style.RESET_ALL} WITH MORE THAN {threshold} {Fore.GREEN}CHARACTERS{Style.RESET_ALL}: {Fore.BLUE}{len(line_contents)}{Style.RESET_ALL}\n",
+        ]
         for line_num, text_lines in line_contents:
-            print(f"{Fore.YELLOW}({line_num})\t{Style.RESET_ALL}", end=" ")
-            first_line = True
-            for line in text_lines:
-                if not first_line:
-                    print("\t ", end="")
-                print(f"{line} {Fore.GREEN}({len(line)})")
-                first_line = False
-            print()
+            prefix = f"{Fore.YELLOW}({line_num})\t{Style.RESET_ALL} "
+            for line, length in text_lines:
+                out.append(f"{prefix}{line} {Fore.GREEN}({length}){Style.RESET_ALL}")
+                prefix = "\t "
+            out.append("")
+        write_lines(out)
     else:
         print("\n------------------------------------------")
-        print(f"\n{Fore.GREEN}No lines with more than 42 characters detected")
+        print(f"\n{Fore.GREEN}No lines with more than {threshold} characters detected")
 
     if stats['short_duration_lines']:
-        print("------------------------------------------")
-        print(f"\nLINES WITH LESS THAN 1 SECOND DURATION:\n")
+        out = ["------------------------------------------", "\nLINES WITH LESS THAN 1 SECOND DURATION:\n"]
         for line in stats['short_duration_lines']:
-            print(f"{Fore.YELLOW}Line ({line['number']}):")
-            print(f"Time: {format_timedelta(line['start'])} --> {format_timedelta(line['end'])}")
-            print(f"Duration: {Fore.RED}{format_timedelta(line['duration'])}")
-            for text in line['text']:
-                print(f"  {clean_text(text)} {Fore.GREEN}({len(clean_text(text))})")
-            print()
-        print(f"Total lines with less than 1s duration: {Fore.BLUE}{len(stats['short_duration_lines'])}")
+            out.append(f"{Fore.YELLOW}Line ({line['number']}):{Style.RESET_ALL}")
+            out.append(f"Time: {format_ms(line['start'])} --> {format_ms(line['end'])}")
+            out.append(f"Duration: {Fore.RED}{format_ms(line['duration'])}{Style.RESET_ALL}")
+            for text, length in line['clean_text']:
+                out.append(f"  {text} {Fore.GREEN}({length}){Style.RESET_ALL}")
+            out.append("")
+        out.append(f"Total lines with less than 1s duration: {Fore.BLUE}{len(stats['short_duration_lines'])}{Style.RESET_ALL}")
+        write_lines(out)
     else:
         print("------------------------------------------")     
         print(f"\n{Fore.GREEN}No lines with less than 1 second detected.")
 
     if stats['overlaps']:
-        print("------------------------------------------")
-        counter = 0
-        for overlap_info in stats['overlaps']:
-            counter += 1
-        print(f"\nOVERLAPPING LINES DETECTED: {Fore.BLUE}{counter}\n")
-        counter = 1
-        for overlap_info in stats['overlaps']:
-            subtitle1, start1, end1 = overlap_info[0]
-            subtitle2, start2, end2 = overlap_info[1]
-            overlap_duration = overlap_info[2]
-
-            print(f"{Fore.BLUE}{counter}")
-            counter += 1
-            print(f"{Fore.RED}1th subtitle {Fore.YELLOW}(line {subtitle1[3]}){Style.RESET_ALL}:")
-            print(f"Time: {Fore.BLUE}{format_timedelta(start1)}{Style.RESET_ALL} --> {Fore.BLUE}{format_timedelta(end1)}")
-            for text_line in subtitle1[2]:
-                print(f"  {clean_text(text_line)} {Fore.GREEN}({len(clean_text(text_line))})")
-            
-            print(f"\n{Fore.RED}2nd subtitle {Fore.YELLOW}(line {subtitle2[3]}){Style.RESET_ALL}:")
-            print(f"Time: {Fore.BLUE}{format_timedelta(start2)}{Style.RESET_ALL} --> {Fore.BLUE}{format_timedelta(end2)}")
-            for text_line in subtitle2[2]:
-                print(f"  {clean_text(text_line)} {Fore.GREEN}({len(clean_text(text_line))})")
-            
-            print(f"\nOverlap duration: {Fore.RED}{format_timedelta(overlap_duration)}")
-            print(f"Overlap time: {Fore.BLUE}{format_timedelta(start2)}{Style.RESET_ALL} --> {Fore.BLUE}{format_timedelta(end1)}")
-            print("\n" + "- " * 10 + "\n")
+        out = [
+            "------------------------------------------",
+            f"\nOVERLAPPING LINES DETECTED: {Fore.BLUE}{len(stats['overlaps'])}{Style.RESET_ALL}\n",
+        ]
+        for counter, (first, second, overlap_duration) in enumerate(stats['overlaps'], 1):
+            subtitle1 = subtitles[first]
+            subtitle2 = subtitles[second]
+            start1, end1 = subtitle1.start, subtitle1.end
+            start2, end2 = subtitle2.start, subtitle2.end
+
+            out.append(f"{Fore.BLUE}{counter}{Style.RESET_ALL}")
+            out.append(f"{Fore.RED}1th subtitle {Fore.YELLOW}(line {subtitle1.number}){Style.RESET_ALL}:")
+            out.append(f"Time: {Fore.BLUE}{format_ms(start1)}{Style.RESET_ALL} --> {Fore.BLUE}{format_ms(end1)}{Style.RESET_ALL}")
+            for text, length in zip(subtitle1.clean_lines, subtitle1.lengths):
+                out.append(f"  {text} {Fore.GREEN}({length}){Style.RESET_ALL}")
+
+            out.append(f"\n{Fore.RED}2nd subtitle {Fore.YELLOW}(line {subtitle2.number}){Style.RESET_ALL}:")
+            out.append(f"Time: {Fore.BLUE}{format_ms(start2)}{Style.RESET_ALL} --> {Fore.BLUE}{format_ms(end2)}{Style.RESET_ALL}")
+            for text, length in zip(subtitle2.clean_lines, subtitle2.lengths):
+                out.append(f"  {text} {Fore.GREEN}({length}){Style.RESET_ALL}")
+
+            out.append(f"\nOverlap duration: {Fore.RED}{format_ms(overlap_duration)}{Style.RESET_ALL}")
+            out.append(f"Overlap time: {Fore.BLUE}{format_ms(start2)}{Style.RESET_ALL} --> {Fore.BLUE}{format_ms(end1)}{Style.RESET_ALL}")
+            out.append("\n" + "- " * 10 + "\n")
+        write_lines(out)
     else:
         print("\n------------------------------------------")
         print(f"\n{Fore.GREEN}No overlapping lines detected.\n")
@@ -1,189 +1,265 @@
+import codecs
+from array import array
 import os
 import re
+import sys
+from collections import Counter
 import chardet
-from datetime import timedelta
-from colorama import Fore, init, Style
-from typing import Dict, List, Tuple
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 from tabulate import tabulate
 
-init(autoreset=True)
-
-def detect_encoding(file_path: str) -> str:
-    """Detect the encoding of the file using chardet."""
-    with open(file_path, 'rb') as file:
-        raw_data = file.read()
-    result = chardet.detect(raw_data)
-    return result['encoding'] if result else 'not found'
-
-def parse_time(timestamp: str) -> timedelta:
-    """Convert SRT timestamp (HH:MM:SS,mmm) to timedelta."""
-    hours, minutes, seconds = map(int, timestamp[:8].split(':'))
-    milliseconds = int(timestamp[9:12])
-    return timedelta(hours=hours, minutes=minutes, seconds=seconds, milliseconds=milliseconds)
-
-def format_timedelta(td: timedelta) -> str:
-    """Format timedelta to string in HH:MM:SS,mmm format."""
-    total_seconds = int(td.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
-    milliseconds = td.microseconds // 1000
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+if sys.stdout.isatty():
+    from colorama import Fore, Style, init
+    init(autoreset=True)
+else:
+    # Output is redirected: colorama would only strip the codes again, so don't emit any
+    class _NoColor:
+        def __getattr__(self, name):
+            return ''
+    Fore = Style = _NoColor()
+
+CLEAN_CACHE_SIZE = 65536
+ENCODING_SAMPLE_SIZE = 64 * 1024
+BOM_ENCODINGS = ('UTF-8-SIG', 'UTF-16')  # Codificações vindas do BOM (ver _detect_encoding)
+
+# Campos somados entre arquivos no relatório comparativo
+SUMMED_FIELDS = (
+    'num_lines', 'sum_durations', 'display_percentage', 'words_per_second',
+    'words_per_line', 'chars_per_line', 'single_lines', 'double_lines',
+    'triple_plus_lines', 'overlaps',
+)
+
+# HTML tags, formatting blocks like {\an8} and other codes like \N, in a single pass
+_CLEAN_RE = re.compile(r'<[^>]*>|\{[^}]*\}|\\[a-zA-Z]+\b')
+_strip_markup = _CLEAN_RE.sub  # bound once: clean_text runs for every text line
+# One subtitle block: number line, timing line (e.g. 00:00:01,600 --> 00:00:03,200)
+# and the text lines up to the next blank line
+_SRT_RE = re.compile(
+    r'^([^\n]*)\n'
+    r'(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})[^\n]*'
+    r'((?:\n[^\n]+)*)',
+    re.MULTILINE
+)
+
+def _detect_encoding(raw_data: bytes, encoding_hint: Optional[str] = None) -> str:
+    """
+    Detect the encoding of raw SRT bytes. BOMs, plain ASCII and valid UTF-8
+    (the vast majority of files) are recognized without chardet. Otherwise
+    `encoding_hint` (e.g. the encoding of the previous file in the same
+    directory) is used if it is a multi-byte codec such as Shift_JIS and the
+    bytes decode with it; single-byte codecs like latin-1 decode almost
+    anything, so they can't confirm a guess. chardet is only run on a sample
+    when none of those apply (or on the whole file, when the sample's result
+    can't decode it).
+    """
+    if raw_data.startswith(codecs.BOM_UTF8):
+        return 'UTF-8-SIG'
+    if raw_data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'UTF-16'
+    if raw_data.isascii():
+        return 'ascii'
+    try:
+        raw_data.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    if encoding_hint and not _one_char_per_byte(encoding_hint) and _decodes(raw_data, encoding_hint):
+        return encoding_hint
+    encoding = chardet.detect(raw_data[:ENCODING_SAMPLE_SIZE])['encoding']
+    if not _decodes(raw_data, encoding):
+        # O trecho não representa o arquivo (ex.: só ASCII no início): detecta no arquivo inteiro
+        encoding = chardet.detect(raw_data)['encoding']
+    return encoding
+
+@lru_cache(maxsize=None)
+def _one_char_per_byte(encoding: str) -> bool:
+    """
+    Whether every byte decodes to exactly one character (latin-1, cp1252, ...),
+    so decoding can't reject foreign input. Counted with errors='replace', so
+    utf-8 is True and UTF-16 is False; _detect_encoding settles both before any
+    hint is tried. Unknown encodings are True, i.e. never trusted as a hint.
+    """
+    try:
+        return len(bytes(range(256)).decode(encoding, 'replace')) == 256
+    except LookupError:
+        return True
 
+def _decodes(raw_data: bytes, encoding: Optional[str]) -> bool:
+    """Whether `raw_data` decodes without errors with `encoding`."""
+    try:
+        raw_data.decode(encoding)
+        return True
+    except (UnicodeDecodeError, LookupError, TypeError):
+        return False
+
+def parse_time(timestamp: str) -> int:
+    """Convert SRT timestamp (HH:MM:SS,mmm) to milliseconds."""
+    return (int(timestamp[0:2]) * 3600000 + int(timestamp[3:5]) * 60000
+            + int(timestamp[6:8]) * 1000 + int(timestamp[9:12]))
+
+def format_ms(ms: int) -> str:
+    """Format milliseconds to string in HH:MM:SS,mmm format."""
+    sign = "-" if ms < 0 else ""
+    total_seconds, milliseconds = divmod(abs(ms), 1000)
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+@lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def clean_text(text: str) -> str:
-    """Remove HTML tags and special formatting codes."""
-    text = re.sub(r'<.*?>', '', text)
-    text = re.sub(r'\{.*?\}', '', text)
-    text = re.sub(r'\\[a-zA-Z]+\b', '', text)
-    return text.strip()
+    """Remove HTML tags and special formatting codes (cached, since short lines repeat a lot)."""
+    # Most subtitle lines carry no markup at all: skip the regex for them
+    if '<' not in text and '{' not in text and '\\' not in text:
+        return text.strip()
+    return _strip_markup('', text).strip()
 
-def _merge_intervals(intervals: List[Tuple[timedelta, timedelta]]) -> timedelta:
+def _merge_intervals(starts: np.ndarray, ends: np.ndarray) -> int:
     """
-    Recebe uma lista de (start, end) e retorna a soma de tempo total desses intervalos,
+    Recebe os arrays de início e fim (ms) e retorna a soma de tempo total desses intervalos,
     unificando sobreposições.
     Exemplo: [(0s,5s), (2s,6s)] => total de 6s, e não 5+4=9s.
     """
-    if not intervals:
-        return timedelta(0)
-    
-    # Ordena pelos tempos de início
-    intervals.sort(key=lambda x: x[0])
+    if not len(starts):
+        return 0
     
-    merged_intervals = []
-    current_start, current_end = intervals[0]
+    # Ordena pelos tempos de início (legendas quase sempre já vêm em ordem: pula o argsort)
+    if np.all(starts[1:] >= starts[:-1]):
+        s = starts
+        e = ends
+    else:
+        order = np.argsort(starts, kind='stable')
+        s = starts[order]
+        e = ends[order]
     
-    for i in range(1, len(intervals)):
-        start, end = intervals[i]
-        if start <= current_end:
-            # Há sobreposição; ajusta o final se necessário
-            current_end = max(current_end, end)
-        else:
-            # Intervalo novo não se sobrepõe
-            merged_intervals.append((current_start, current_end))
-            current_start, current_end = start, end
+    # Legendas que terminam antes de começar: o maior fim acumulado passaria de um
+    # grupo para o outro, então usa o loop, que reinicia o fim a cada grupo
+    if (e < s).any():
+        total = 0
+        current_start, current_end = int(s[0]), int(e[0])
+        for start, end in zip(s[1:].tolist(), e[1:].tolist()):
+            if start <= current_end:
+                current_end = max(current_end, end)
+            else:
+                total += current_end - current_start
+                current_start, current_end = start, end
+        return total + current_end - current_start
     
-    # Adiciona o último intervalo
-    merged_intervals.append((current_start, current_end))
+    # Um intervalo abre um novo grupo quando começa depois do maior fim visto até então
+    running_end = np.maximum.accumulate(e)
+    new_group = np.empty(len(s), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = s[1:] > running_end[:-1]
+    group_starts = np.flatnonzero(new_group)
     
     # Soma total dos intervalos mesclados
-    total = timedelta(0)
-    for st, en in merged_intervals:
-        total += (en - st)
-    return total
+    merged_start = s[group_starts]
+    merged_end = np.maximum.reduceat(running_end, group_starts)
+    return int((merged_end - merged_start).sum())
 
-def parse_srt(file_path: str) -> List[Tuple[timedelta, timedelta, List[str], int, str]]:
+def parse_srt(file_path: str, encoding_hint: Optional[str] = None) -> Iterator[Tuple[int, int, List[str], int, str]]:
     """
-    Parse an SRT file and return a list of subtitles in the format:
-    (start_time, end_time, [text_lines], line_number, encoding).
+    Parse an SRT file, yielding one subtitle at a time in the format:
+    (start_ms, end_ms, [text_lines], line_number, encoding).
+    `encoding_hint` is tried before chardet (see _detect_encoding).
+    Errors reading or decoding the file are raised to the caller.
     """
-    try:
-        encoding = detect_encoding(file_path)
-        with open(file_path, 'r', encoding=encoding) as file:
-            content = file.read()
-        
-        blocks = content.strip().split('\n\n')
-        subtitles = []
+    # Lê o arquivo uma única vez: a detecção e a decodificação usam os mesmos bytes
+    with open(file_path, 'rb') as file:
+        raw_data = file.read()
+    encoding = _detect_encoding(raw_data, encoding_hint)
+    content = raw_data.decode(encoding).replace('\r\n', '\n').replace('\r', '\n')
+    del raw_data  # O gerador fica pausado entre legendas: não mantém duas cópias do arquivo
+    
+    # Um único scan do regex sobre o arquivo inteiro, bloco a bloco
+    for match in _SRT_RE.finditer(content):
+        number, start, end, text = match.groups()
+        start_time = parse_time(start)
+        end_time = parse_time(end)
         
-        for block in blocks:
-            lines = block.split('\n')
-            if len(lines) < 2:
-                continue
-            
-            # Exemplo de linha: 00:00:01,600 --> 00:00:03,200
-            time_match = re.match(r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})", lines[1])
-            if not time_match:
-                continue
-
-            start_time = parse_time(time_match.group(1))
-            end_time = parse_time(time_match.group(2))
-            
-            try:
-                line_number = int(lines[0])
-            except ValueError:
-                line_number = 0  # Caso a primeira linha não seja um número
-            
-            # Limpa e filtra linhas vazias
-            text_lines = [clean_text(ln) for ln in lines[2:] if clean_text(ln)]
-            subtitles.append((start_time, end_time, text_lines, line_number, encoding))
+        try:
+            line_number = int(number)
+        except ValueError:
+            line_number = 0  # Caso a primeira linha não seja um número
         
-        return subtitles
-    except Exception as e:
-        print(f"{Fore.RED}Error processing file {file_path}: {str(e)}")
-        return []
+        # Limpa e filtra linhas vazias
+        text_lines = [cleaned for ln in text.split('\n')[1:] if (cleaned := clean_text(ln))]
+        yield (start_time, end_time, text_lines, line_number, encoding)
 
-def analyze_subtitle_file(file_path: str) -> Dict:
+def analyze_subtitle_file(file_path: str, encoding_hint: Optional[str] = None) -> Dict:
     """Analyze a single subtitle file and return statistics."""
-    subtitles = parse_srt(file_path)
-    if not subtitles:
-        return None
-    
-    num_lines = len(subtitles)
-    
-    # Início e fim (p/ cálculo de duração do arquivo)
-    start_time = subtitles[0][0] if subtitles else timedelta(0)
-    end_time = subtitles[-1][1] if subtitles else timedelta(0)
-    total_duration = end_time - start_time
-
-    # Intervalos para cálculo real de exibição (sobreposições)
-    intervals = [(s[0], s[1]) for s in subtitles]
-    real_display_time = _merge_intervals(intervals)
-    
-    total_silence = total_duration - real_display_time
+    # Consome as legendas conforme são lidas, guardando só os tempos (ms) e agregados
+    starts = array('q')
+    ends = array('q')
+    encoding = "Unknown"
 
-    # Cálculo de palavras, caracteres e durações
+    # Cálculo de palavras e caracteres
     total_words = 0
     total_chars = 0
 
-    durations = []
-    line_counts = []
+    # Classificação por número de linhas, feita no mesmo loop
+    single_lines = double_lines = triple_plus_lines = 0
     
-    for (start, end, text_lines, _, _) in subtitles:
-        dur = (end - start).total_seconds()
-        durations.append(dur)
-        
+    for (start, end, text_lines, _, encoding) in parse_srt(file_path, encoding_hint):
+        starts.append(start)
+        ends.append(end)
+
         line_count = len(text_lines)
-        line_counts.append(line_count)
+        if line_count == 1:
+            single_lines += 1
+        elif line_count == 2:
+            double_lines += 1
+        elif line_count >= 3:
+            triple_plus_lines += 1
         
-        for line in text_lines:
-            total_words += len(line.split())
-            total_chars += len(line)
-
-    single_lines = sum(1 for c in line_counts if c == 1)
-    double_lines = sum(1 for c in line_counts if c == 2)
-    triple_plus_lines = sum(1 for c in line_counts if c >= 3)
-
-    if durations:
-        sum_durations = sum(durations)
-        file_min_duration = min(durations)
-        file_max_duration = max(durations)
-        avg_duration = sum_durations / len(durations)
-    else:
-        sum_durations = 0
-        file_min_duration = 0
-        file_max_duration = 0
-        avg_duration = 0
+        # Linhas já vêm limpas do parse_srt; contagens por legenda em chamadas C
+        total_words += len(' '.join(text_lines).split())
+        total_chars += sum(map(len, text_lines))
+
+    num_lines = len(starts)
+    if not num_lines:
+        return None
+
+    # Início e fim (p/ cálculo de duração do arquivo)
+    start_time = starts[0]
+    end_time = ends[-1]
+    total_duration = end_time - start_time
+
+    # Tempos em arrays NumPy (ms) para as reduções numéricas
+    starts = np.frombuffer(starts, dtype=np.int64)
+    ends = np.frombuffer(ends, dtype=np.int64)
+    durations = ends - starts
+
+    # Tempo real de exibição, unificando sobreposições
+    real_display_time = _merge_intervals(starts, ends)
+    
+    total_silence = total_duration - real_display_time
+
+    # Durações em segundos
+    sum_durations = int(durations.sum()) / 1000
+    file_min_duration = int(durations.min()) / 1000
+    file_max_duration = int(durations.max()) / 1000
+    avg_duration = sum_durations / num_lines
 
     # Overlap detection (contagem simples)
-    overlaps = 0
-    for i in range(num_lines - 1):
-        if subtitles[i][1] > subtitles[i + 1][0]:
-            overlaps += 1
+    overlaps = int(np.count_nonzero(ends[:-1] > starts[1:]))
 
     # Taxa de exibição (words/sec) baseada no tempo real exibido
-    display_seconds = real_display_time.total_seconds()
+    display_seconds = real_display_time / 1000
     words_per_second = total_words / display_seconds if display_seconds > 0 else 0
 
     # Porcentagem de display
-    duration_seconds = total_duration.total_seconds() if total_duration.total_seconds() > 0 else 1
+    duration_seconds = total_duration / 1000 if total_duration > 0 else 1
     display_percentage = (display_seconds / duration_seconds * 100)
 
     return {
         'filename': os.path.basename(file_path),
         'num_lines': num_lines,
-        'duration': format_timedelta(total_duration),
-        'display_time': format_timedelta(real_display_time),
-        'silence_time': format_timedelta(total_silence),
+        'duration': format_ms(total_duration),
+        'display_time': format_ms(real_display_time),
+        'silence_time': format_ms(total_silence),
         'display_percentage': display_percentage,
         
         'total_words': total_words,
@@ -202,9 +278,32 @@ def analyze_subtitle_file(file_path: str) -> Dict:
         'double_lines': double_lines,
         'triple_plus_lines': triple_plus_lines,
         'overlaps': overlaps,
-        'encoding': subtitles[0][4] if subtitles else "Unknown"
+        'encoding': encoding
     }
 
+def _analyze_files(file_paths: List[str]) -> List[Tuple[Optional[Dict], Optional[str]]]:
+    """
+    Analyze a batch of files in order, passing the last detected encoding
+    as the hint for the next file (files in one directory usually share it).
+    Encodings found from a BOM are not passed on: they say nothing about the
+    next file, and UTF-16 decodes almost any even-length input.
+    Returns one (stats, error message) pair per file; the messages are printed
+    by the caller, so they stay next to the file's report.
+    """
+    results = []
+    encoding_hint = None
+    for file_path in file_paths:
+        try:
+            stats = analyze_subtitle_file(file_path, encoding_hint)
+            error = None
+        except Exception as e:
+            stats = None
+            error = f"Error processing file {file_path}: {str(e)}"
+        if stats and stats['encoding'] not in BOM_ENCODINGS:
+            encoding_hint = stats['encoding']
+        results.append((stats, error))
+    return results
+
 def print_stats_dict(stats: Dict) -> None:
     """
     Imprime o dicionário de estatísticas de forma tabulada,
@@ -235,20 +334,36 @@ def print_stats_dict(stats: Dict) -> None:
 
 def analyze_directory(directory_path: str) -> None:
     """Analyze all SRT files in the given directory with enhanced comparative statistics."""
-    srt_files = [f for f in os.listdir(directory_path) if f.lower().endswith('.srt')]
-    if not srt_files:
+    with os.scandir(directory_path) as entries:
+        srt_entries = [e for e in entries if e.name.lower().endswith('.srt') and e.is_file()]
+    if not srt_entries:
         print(f"{Fore.RED}No SRT files found in the directory!")
         return
     
+    # Lotes de arquivos analisados em paralelo (cada lote reaproveita a codificação
+    # detectada entre seus arquivos), um lote por processo para ocupar todos os núcleos
+    # mesmo com poucos arquivos; a impressão segue a ordem original
+    paths = [e.path for e in srt_entries]
+    workers = os.cpu_count() or 1
+    batch_size = -(-len(paths) // workers)  # ceil
+    batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+        all_results = [result for batch in executor.map(_analyze_files, batches) for result in batch]
+
     results = []
-    for file in srt_files:
-        file_path = os.path.join(directory_path, file)
-        stats = analyze_subtitle_file(file_path)
-        
+    # Contagens simples acumuladas já durante a coleta
+    encoding_dist = Counter()
+    files_with_overlaps = 0
+    for file, (stats, error) in zip((e.name for e in srt_entries), all_results):
+        if error:
+            print(f"{Fore.RED}{error}")
         if stats:
             print(f"\n{Fore.CYAN}=== Stats for file: {file} ===")
             print_stats_dict(stats)
             results.append(stats)
+            encoding_dist[stats['encoding']] += 1
+            if stats['overlaps'] > 0:
+                files_with_overlaps += 1
         else:
             print(f"\n{Fore.RED}Could not process file: {file}. No stats available.")
 
@@ -256,11 +371,37 @@ def analyze_directory(directory_path: str) -> None:
         print(f"{Fore.RED}No valid subtitle files could be processed!")
         return
     
-    df = pd.DataFrame(results)
-    
+    # Poucos arquivos: listas de dicts e reduções em Python puro (sem o overhead do pandas)
+    num_files = len(results)
+
+    # Um único passe sobre os resultados calcula todas as somas, extremos e rankings.
+    # Comparações estritas mantêm o primeiro arquivo em caso de empate.
+    totals = dict.fromkeys(SUMMED_FIELDS, 0)
+    first = results[0]
+    min_line_duration = first['file_min_duration']
+    max_line_duration = first['file_max_duration']
+    longest = shortest = fastest = slowest = most_overlaps = first
+    for r in results:
+        for field in SUMMED_FIELDS:
+            totals[field] += r[field]
+        if r['file_min_duration'] < min_line_duration:
+            min_line_duration = r['file_min_duration']
+        if r['file_max_duration'] > max_line_duration:
+            max_line_duration = r['file_max_duration']
+        if r['num_lines'] > longest['num_lines']:
+            longest = r
+        if r['num_lines'] < shortest['num_lines']:
+            shortest = r
+        if r['words_per_second'] > fastest['words_per_second']:
+            fastest = r
+        if r['words_per_second'] < slowest['words_per_second']:
+            slowest = r
+        if r['overlaps'] > most_overlaps['overlaps']:
+            most_overlaps = r
+
     # Cálculo global para Average Line Duration (seconds)
-    total_sum_durations = df['sum_durations'].sum()
-    total_lines = df['num_lines'].sum()
+    total_sum_durations = totals['sum_durations']
+    total_lines = totals['num_lines']
     global_avg_duration = total_sum_durations / total_lines if total_lines else 0
 
     # --- Enhanced Comparative Statistics ---
@@ -269,9 +410,9 @@ def analyze_directory(directory_path: str) -> None:
     # 1. Basic File Statistics
     print(f"{Fore.YELLOW}Basic File Statistics:")
     basic_stats = {
-        'Total Files Analyzed': len(df),
-        'Total Combined Lines': df['num_lines'].sum(),
-        'Average Lines per File': df['num_lines'].mean(),
+        'Total Files Analyzed': num_files,
+        'Total Combined Lines': total_lines,
+        'Average Lines per File': total_lines / num_files,
     }
     # Exibimos com 2 casas decimais se for float
     print(tabulate(
@@ -282,10 +423,10 @@ def analyze_directory(directory_path: str) -> None:
     # 2. Timing Analysis
     print(f"\n{Fore.YELLOW}Timing Analysis:")
     timing_stats = {
-        'Average Display Time %': df['display_percentage'].mean(),
+        'Average Display Time %': totals['display_percentage'] / num_files,
         'Average Line Duration (seconds)': global_avg_duration,
-        'Shortest Line Duration (seconds)': df['file_min_duration'].min(),
-        'Longest Line Duration (seconds)': df['file_max_duration'].max()
+        'Shortest Line Duration (seconds)': min_line_duration,
+        'Longest Line Duration (seconds)': max_line_duration
     }
     print(tabulate(
         [[k, f"{v:.2f}" if isinstance(v, float) else v] for k, v in timing_stats.items()],
@@ -295,9 +436,9 @@ def analyze_directory(directory_path: str) -> None:
     # 3. Reading Speed Analysis
     print(f"\n{Fore.YELLOW}Reading Speed Analysis:")
     reading_stats = {
-        'Average Words per Second': df['words_per_second'].mean(),
-        'Fastest Reading Speed': df['words_per_second'].max(),
-        'Slowest Reading Speed': df['words_per_second'].min(),
+        'Average Words per Second': totals['words_per_second'] / num_files,
+        'Fastest Reading Speed': fastest['words_per_second'],
+        'Slowest Reading Speed': slowest['words_per_second'],
     }
     print(tabulate(
         [[k, f"{v:.2f}" if isinstance(v, float) else v] for k, v in reading_stats.items()],
@@ -306,13 +447,13 @@ def analyze_directory(directory_path: str) -> None:
 
     # 4. Text Structure Analysis
     print(f"\n{Fore.YELLOW}Text Structure Analysis:")
-    total_lines_all = df['num_lines'].sum()
+    total_lines_all = total_lines
     structure_stats = {
-        'Average Words per Line': df['words_per_line'].mean(),
-        'Average Characters per Line': df['chars_per_line'].mean(),
-        'Single-Line Subtitles %': (df['single_lines'].sum() / total_lines_all * 100) if total_lines_all else 0,
-        'Double-Line Subtitles %': (df['double_lines'].sum() / total_lines_all * 100) if total_lines_all else 0,
-        'Triple+ Line Subtitles %': (df['triple_plus_lines'].sum() / total_lines_all * 100) if total_lines_all else 0
+        'Average Words per Line': totals['words_per_line'] / num_files,
+        'Average Characters per Line': totals['chars_per_line'] / num_files,
+        'Single-Line Subtitles %': (totals['single_lines'] / total_lines_all * 100) if total_lines_all else 0,
+        'Double-Line Subtitles %': (totals['double_lines'] / total_lines_all * 100) if total_lines_all else 0,
+        'Triple+ Line Subtitles %': (totals['triple_plus_lines'] / total_lines_all * 100) if total_lines_all else 0
     }
     print(tabulate(
         [[k, f"{v:.2f}" if isinstance(v, float) else v] for k, v in structure_stats.items()],
@@ -321,11 +462,12 @@ def analyze_directory(directory_path: str) -> None:
 
     # 5. Quality Metrics
     print(f"\n{Fore.YELLOW}Quality Metrics:")
+    total_overlaps = totals['overlaps']
     quality_stats = {
-        'Total Overlaps Found': df['overlaps'].sum(),
-        'Average Overlaps per File': df['overlaps'].mean(),
-        'Files with Overlaps': len(df[df['overlaps'] > 0]),
-        'Files with Zero Overlaps': len(df[df['overlaps'] == 0]),
+        'Total Overlaps Found': total_overlaps,
+        'Average Overlaps per File': total_overlaps / num_files,
+        'Files with Overlaps': files_with_overlaps,
+        'Files with Zero Overlaps': num_files - files_with_overlaps,
     }
     print(tabulate(
         [[k, f"{v:.2f}" if isinstance(v, float) else v] for k, v in quality_stats.items()],
@@ -334,44 +476,34 @@ def analyze_directory(directory_path: str) -> None:
 
     # 6. File Rankings (Longest/Shortest File baseados em num_lines)
     print(f"\n{Fore.YELLOW}Notable Files:")
-    rankings = {}
-    if len(df) > 0:
-        # Garante que exista ao menos 1 arquivo para idxmax() e idxmin()
-        max_idx = df['num_lines'].idxmax()
-        min_idx = df['num_lines'].idxmin()
-        max_spd_idx = df['words_per_second'].idxmax()
-        min_spd_idx = df['words_per_second'].idxmin()
-        max_ovp_idx = df['overlaps'].idxmax()
-
-        rankings = {
-            'Longest File': (
-                f"{df.iloc[max_idx]['filename']} "
-                f"{Fore.BLUE}({int(df.iloc[max_idx]['num_lines'])} lines){Style.RESET_ALL}"
-            ),
-            'Shortest File': (
-                f"{df.iloc[min_idx]['filename']} "
-                f"{Fore.BLUE}({int(df.iloc[min_idx]['num_lines'])} lines){Style.RESET_ALL}"
-            ),
-            'Fastest Reading Speed': (
-                f"{df.iloc[max_spd_idx]['filename']} "
-                f"{Fore.BLUE}({df.iloc[max_spd_idx]['words_per_second']:.2f} w/s){Style.RESET_ALL}"
-            ),
-            'Slowest Reading Speed': (
-                f"{df.iloc[min_spd_idx]['filename']} "
-                f"{Fore.BLUE}({df.iloc[min_spd_idx]['words_per_second']:.2f} w/s){Style.RESET_ALL}"
-            ),
-            'Most Overlaps': (
-                f"{df.iloc[max_ovp_idx]['filename']} "
-                f"{Fore.BLUE}({int(df.iloc[max_ovp_idx]['overlaps'])} overlaps){Style.RESET_ALL}"
-            )
-        }
+    rankings = {
+        'Longest File': (
+            f"{longest['filename']} "
+            f"{Fore.BLUE}({longest['num_lines']} lines){Style.RESET_ALL}"
+        ),
+        'Shortest File': (
+            f"{shortest['filename']} "
+            f"{Fore.BLUE}({shortest['num_lines']} lines){Style.RESET_ALL}"
+        ),
+        'Fastest Reading Speed': (
+            f"{fastest['filename']} "
+            f"{Fore.BLUE}({fastest['words_per_second']:.2f} w/s){Style.RESET_ALL}"
+        ),
+        'Slowest Reading Speed': (
+            f"{slowest['filename']} "
+            f"{Fore.BLUE}({slowest['words_per_second']:.2f} w/s){Style.RESET_ALL}"
+        ),
+        'Most Overlaps': (
+            f"{most_overlaps['filename']} "
+            f"{Fore.BLUE}({most_overlaps['overlaps']} overlaps){Style.RESET_ALL}"
+        )
+    }
     print(tabulate([[k, v] for k, v in rankings.items()], tablefmt='simple'))
 
     # 7. Encoding Analysis
     print(f"\n{Fore.YELLOW}Encoding Distribution:")
-    encoding_dist = df['encoding'].value_counts()
     print(tabulate(
-        [[enc, cnt] for enc, cnt in encoding_dist.items()],
+        [[enc, cnt] for enc, cnt in encoding_dist.most_common()],
         headers=['Encoding', 'Count'],
         tablefmt='simple'
     ))